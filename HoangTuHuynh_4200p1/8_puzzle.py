@@ -1,5 +1,8 @@
 import heapq
+import importlib.util
+import os
 import random
+import sys
 
 
 class PuzzleState:
@@ -37,7 +40,10 @@ class PuzzleState:
     def heuristic(self, func):
         return func(self.board, self.goal) + self.moves
 
-def astar_search(start_state, heuristic_func, max_depth):
+def astar_search(start_state, heuristic_func, max_depth, stats=None):
+    if stats is not None:
+        # Pushed states carry the counted function, so heap tie-breaks in __lt__ are counted too
+        heuristic_func = stats.counted(heuristic_func)
     frontier = []
     heapq.heappush(frontier, (0, start_state))
     explored = set()
@@ -46,6 +52,8 @@ def astar_search(start_state, heuristic_func, max_depth):
     while frontier:
         _, current_state = heapq.heappop(frontier)
         search_cost += 1  # Increment search cost for each state explored
+        if stats is not None:
+            stats.expand(current_state.moves)
 
         if current_state.is_goal():
             return current_state, search_cost  # Return the solution and the search cost
@@ -55,11 +63,19 @@ def astar_search(start_state, heuristic_func, max_depth):
 
         explored.add(current_state.board)
 
-        for state in current_state.next_states():
-            if state.board not in explored:
+        children = current_state.next_states()
+        if stats is not None:
+            stats.generate(len(children))
+        for state in children:
+            seen = state.board in explored
+            if stats is not None:
+                stats.cache(seen)  # A hit means the explored set pruned the child
+            if not seen:
                 new_state = PuzzleState(state.board, state.goal, state.moves, heuristic_func, parent=current_state)
                 total_cost = new_state.heuristic(heuristic_func)
                 heapq.heappush(frontier, (total_cost, new_state))
+        if stats is not None:
+            stats.frontier(len(frontier))
 
     return None, search_cost  # No solution found, return search cost anyway
 
@@ -87,6 +103,26 @@ def generate_random_puzzle():
     random.shuffle(puzzle)
     return tuple(puzzle)
 
+def load_search_stats():
+    # See the search_stats module docstring for why it is loaded by path
+    if "search_stats" not in sys.modules:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "search_stats.py")
+        spec = importlib.util.spec_from_file_location("search_stats", path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["search_stats"] = module
+        spec.loader.exec_module(module)
+    return sys.modules["search_stats"]
+
+def run_astar_search(initial_state, heuristic_func, max_depth, records=None):
+    # Run A*, appending one SearchStats record to records when it is a list
+    if records is None:
+        return astar_search(initial_state, heuristic_func, max_depth)
+    stats = load_search_stats().SearchStats("astar")
+    with stats.measure():
+        result = astar_search(initial_state, heuristic_func, max_depth, stats)
+    records.append(stats.to_dict())
+    return result
+
 def print_solution(solution_state):
     path = []
     while solution_state:
@@ -97,7 +133,7 @@ def print_solution(solution_state):
         for i in range(0, 9, 3):
             print(' '.join(map(str, state.board[i:i+3])))
         print()  # Optional: for better readability
-def single_test_puzzle():
+def single_test_puzzle(records=None):
     print("Select Input Method:\n[1] Random\n[2] File")
     choice = input("Enter your choice: ")
     if choice == '1':
@@ -120,7 +156,7 @@ def single_test_puzzle():
     initial_state = PuzzleState(initial_board, goal_state, 0, heuristic_func)
 
     max_depth = int(input("Enter Solution Depth (2-20): "))
-    result, search_cost = astar_search(initial_state, heuristic_func, max_depth)
+    result, search_cost = run_astar_search(initial_state, heuristic_func, max_depth, records)
     if result:
         print_solution(result)
         print("Search Cost:", search_cost)
@@ -128,7 +164,7 @@ def single_test_puzzle():
         print("No solution found")
         print("Search Cost:", search_cost)
 
-def multiple_test():
+def multiple_test(records=None):
     test_cases = int(input("Number of test cases: "))
     while test_cases>0:
         row = input().strip().split()
@@ -141,7 +177,7 @@ def multiple_test():
         initial_state = PuzzleState(initial_board, goal_state, 0, heuristic_func)
 
         max_depth = int(input("Enter Solution Depth (2-20): "))
-        result, search_cost = astar_search(initial_state, heuristic_func, max_depth)
+        result, search_cost = run_astar_search(initial_state, heuristic_func, max_depth, records)
         if result:
             print_solution(result)
             print("Search Cost:", search_cost)
@@ -153,14 +189,20 @@ def multiple_test():
 
     
 def main(): 
+    # Set SEARCH_STATS=<file> to write one JSON record per A* run on exit
+    stats_path = os.environ.get("SEARCH_STATS")
+    records = [] if stats_path else None
     while True:
         print("[1] Single Test Puzzle\n[2] Multi-Test Puzzle\n[3] Exit")
         choice = input("Enter your choice: ")
         if choice == '1':
-            single_test_puzzle()
+            single_test_puzzle(records)
         elif choice == '2':
-            multiple_test()
+            multiple_test(records)
         elif choice == '3':
+            if records is not None:
+                load_search_stats().write_records(records, stats_path)
+                print(f"Search stats written to {stats_path}")
             break
     
 
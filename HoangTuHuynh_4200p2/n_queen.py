@@ -1,4 +1,7 @@
+import importlib.util
+import os
 import random
+import sys
 import time
 import numpy as np
 
@@ -39,18 +42,24 @@ def get_neighbors(board):
                 neighbors.append(new_board)
     return neighbors
 
-def steepest_ascent_hill_climbing(board):
+def steepest_ascent_hill_climbing(board, stats=None):
+    heuristic = compute_heuristic if stats is None else stats.counted(compute_heuristic)
     current_board = board
     search_cost = 0
+    step = 0
     while True:
-        current_heuristic = compute_heuristic(current_board)
+        current_heuristic = heuristic(current_board)
         neighbors = get_neighbors(current_board)
         search_cost += len(neighbors)
+        if stats is not None:
+            stats.expand(step, len(neighbors))  # One node per neighbour evaluated, as in search_cost
+            stats.generate(len(neighbors))
+            stats.frontier(len(neighbors))
         next_board = None
         next_heuristic = float('inf')
 
         for neighbor in neighbors:
-            h = compute_heuristic(neighbor)
+            h = heuristic(neighbor)
             if h < next_heuristic:
                 next_board = neighbor
                 next_heuristic = h
@@ -59,6 +68,7 @@ def steepest_ascent_hill_climbing(board):
             break
 
         current_board = next_board
+        step += 1
 
     return current_board, search_cost
 
@@ -85,15 +95,20 @@ def mutate(board):
     board[i] = random.randint(0, n - 1)
     return board
 
-def genetic_algorithm(pop_size, n, generations):
+def genetic_algorithm(pop_size, n, generations, stats=None):
+    heuristic = compute_heuristic if stats is None else stats.counted(compute_heuristic)
+    fitness_func = fitness if stats is None else stats.counted(fitness)
     population = initialize_population(pop_size, n)
     max_heuristic = (n * (n - 1)) // 2
     search_cost = 0
 
     for generation in range(generations):
         new_population = []
-        fitnesses = [fitness(individual, max_heuristic) for individual in population]
+        fitnesses = [fitness_func(individual, max_heuristic) for individual in population]
         search_cost += len(population)
+        if stats is not None:
+            stats.expand(generation, len(population))  # One node per individual evaluated, as in search_cost
+            stats.frontier(len(population))
 
         for _ in range(len(population)):
             x = random_selection(population, fitnesses)
@@ -104,32 +119,55 @@ def genetic_algorithm(pop_size, n, generations):
             new_population.append(child)
 
         population = new_population
+        if stats is not None:
+            stats.generate(len(population))
 
-        best_individual = max(population, key=lambda ind: fitness(ind, max_heuristic))
-        if compute_heuristic(best_individual) == 0:
+        best_individual = max(population, key=lambda ind: fitness_func(ind, max_heuristic))
+        if heuristic(best_individual) == 0:
             return best_individual, search_cost
 
-    return max(population, key=lambda ind: fitness(ind, max_heuristic)), search_cost
+    return max(population, key=lambda ind: fitness_func(ind, max_heuristic)), search_cost
+
+def load_search_stats():
+    # See the search_stats module docstring for why it is loaded by path
+    if "search_stats" not in sys.modules:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "search_stats.py")
+        spec = importlib.util.spec_from_file_location("search_stats", path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["search_stats"] = module
+        spec.loader.exec_module(module)
+    return sys.modules["search_stats"]
+
+def timed_run(name, solver, *args, records=None):
+    # Run a solver and return (result, seconds); when records is a list,
+    # the run is instrumented and its SearchStats record appended
+    if records is None:
+        start_time = time.time()
+        result = solver(*args)
+        return result, time.time() - start_time
+    stats = load_search_stats().SearchStats(name)
+    with stats.measure():
+        result = solver(*args, stats=stats)
+    records.append(stats.to_dict())
+    return result, stats.elapsed
 
 # Running the algorithm on one instance 
-def run_single_instance_experiment(n, pop_size, generations):
+def run_single_instance_experiment(n, pop_size, generations, records=None):
     initial_board = random_board(n)
     print("Initial Board:")
     print_board(initial_board)
 
     # Steepest-Ascent Hill Climbing
-    start_time = time.time()
-    final_board_hc, search_cost_hc = steepest_ascent_hill_climbing(initial_board)
-    hc_time = time.time() - start_time
+    (final_board_hc, search_cost_hc), hc_time = timed_run(
+        "hill_climbing", steepest_ascent_hill_climbing, initial_board, records=records)
     print("Final Board (Steepest-Ascent Hill Climbing):")
     print_board(final_board_hc)
     print(f"Time Taken: {hc_time} seconds")
     print(f"Search Cost: {search_cost_hc}\n")
 
      # Genetic Algorithm
-    start_time = time.time()
-    final_board_ga, search_cost_ga = genetic_algorithm(pop_size, n, generations)
-    ga_time = time.time() - start_time
+    (final_board_ga, search_cost_ga), ga_time = timed_run(
+        "genetic_algorithm", genetic_algorithm, pop_size, n, generations, records=records)
     final_heuristic_ga = compute_heuristic(final_board_ga)
 
     print("Final Board (Genetic Algorithm):")
@@ -144,7 +182,7 @@ def run_single_instance_experiment(n, pop_size, generations):
     print("\n")
 
 # Running the algorithms on multiple instances
-def run_experiments(n, num_instances, pop_size, generations):
+def run_experiments(n, num_instances, pop_size, generations, records=None):
     hill_climbing_success = 0
     ga_success = 0
     hc_search_costs = 0
@@ -156,17 +194,17 @@ def run_experiments(n, num_instances, pop_size, generations):
         initial_board = random_board(n)
 
         # Hill Climbing
-        start_time = time.time()
-        final_board_hc, search_cost_hc = steepest_ascent_hill_climbing(initial_board)
-        hc_time += time.time() - start_time
+        (final_board_hc, search_cost_hc), run_time = timed_run(
+            "hill_climbing", steepest_ascent_hill_climbing, initial_board, records=records)
+        hc_time += run_time
         hc_search_costs += search_cost_hc
         if compute_heuristic(final_board_hc) == 0:
             hill_climbing_success += 1
 
         # Genetic Algorithm
-        start_time = time.time()
-        final_board_ga, search_cost_ga = genetic_algorithm(pop_size, n, generations)
-        ga_time += time.time() - start_time
+        (final_board_ga, search_cost_ga), run_time = timed_run(
+            "genetic_algorithm", genetic_algorithm, pop_size, n, generations, records=records)
+        ga_time += run_time
         ga_search_costs += search_cost_ga
         if compute_heuristic(final_board_ga) == 0:
             ga_success += 1
@@ -185,18 +223,23 @@ def main():
     n = 8  # Size of the board (8x8) 
     pop_size = 100  # Population size for GA
     generations = 100  # Number of generations for GA
+    # Set SEARCH_STATS=<file> to write one JSON record per solver run
+    stats_path = os.environ.get("SEARCH_STATS")
+    records = [] if stats_path else None
 
     print("Welcome to N-Queen Problem")
     choose = int(input("[1] To run one instance\n[2] to run multiple instances\n"))
     if choose == 1:
         # Run single instance experiment
-        run_single_instance_experiment(n, pop_size, generations)
+        run_single_instance_experiment(n, pop_size, generations, records)
     # Run experiments
     else:
         num_instances = int(input("Number of instances: ")) # Number of instances to run
-        results = run_experiments(n, num_instances, pop_size, generations)
+        results = run_experiments(n, num_instances, pop_size, generations, records)
         print("Experiment Results:", results)
+    if records is not None:
+        load_search_stats().write_records(records, stats_path)
+        print(f"Search stats written to {stats_path}")
 
 if __name__ == '__main__':
     main()
-
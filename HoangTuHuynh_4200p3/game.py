@@ -1,4 +1,7 @@
 # Import modules
+import importlib.util
+import os
+import sys
 import time
 import random
 
@@ -129,23 +132,27 @@ def evaluate(player):
 
     return score
 
-def iterative_deepening(player, time_limit):
+def iterative_deepening(player, time_limit, stats=None):
     start_time = time.time()
     best_move = None
     depth = 1
 
     while time.time() - start_time < time_limit:
-        move, _ = alpha_beta(player, -float("inf"), float("inf"), depth, start_time)
+        move, _ = alpha_beta(player, -float("inf"), float("inf"), depth, start_time, stats)
         if move is not None:
             best_move = move
         depth += 1
 
     return best_move
 # Define a function to implement the alpha-beta pruning algorithm
-def alpha_beta(player, alpha, beta, depth, start_time):
+# Pass a SearchStats object as stats to count nodes; ply is the distance from the root and keys the per-depth counts
+def alpha_beta(player, alpha, beta, depth, start_time, stats=None, ply=0):
     # Check if the time limit is exceeded
     if time.time() - start_time > TIME_LIMIT:
         return None, None
+    # Count every position visited, leaves and terminal positions included
+    if stats is not None:
+        stats.expand(ply)
     # Check if the game is over or the depth limit is reached
     if is_win(COMPUTER):
         return None, 1000
@@ -154,7 +161,8 @@ def alpha_beta(player, alpha, beta, depth, start_time):
     elif is_full():
         return None, 0
     elif depth == 0:
-        return None, evaluate(COMPUTER) - evaluate(HUMAN)
+        evaluate_func = evaluate if stats is None else stats.counted(evaluate)
+        return None, evaluate_func(COMPUTER) - evaluate_func(HUMAN)
     # Initialize the best move and the best score
     best_move = None
     if player == COMPUTER:
@@ -163,6 +171,8 @@ def alpha_beta(player, alpha, beta, depth, start_time):
         best_score = float("inf")
     # Loop through the possible moves
     for move in get_moves(player):
+        if stats is not None:
+            stats.generate()
         # Make the move
         make_move(player, move)
         # Recursively call the alpha-beta function with the opposite player and the updated alpha and beta values
@@ -170,7 +180,7 @@ def alpha_beta(player, alpha, beta, depth, start_time):
             next_player = HUMAN
         else:
             next_player = COMPUTER
-        _, score = alpha_beta(next_player, alpha, beta, depth - 1, start_time)
+        _, score = alpha_beta(next_player, alpha, beta, depth - 1, start_time, stats, ply + 1)
         # Undo the move
         undo_move(move)
         # Check if the score is None, meaning the time limit was exceeded
@@ -191,16 +201,18 @@ def alpha_beta(player, alpha, beta, depth, start_time):
             beta = min(beta, best_score)
         # Prune the branch if alpha is greater than or equal to beta
         if alpha >= beta:
+            if stats is not None:
+                stats.cutoff()
             break
     # Return the best move and the best score
     return best_move, best_score
 
 # Define a function to get the computer's move
-def get_computer_move():
+def get_computer_move(stats=None):
     # Get the current time
     start_time = time.time()
     # Call the alpha-beta function with the computer as the player and a large depth
-    move = iterative_deepening(COMPUTER, TIME_LIMIT)
+    move = iterative_deepening(COMPUTER, TIME_LIMIT, stats)
     # Check if the move is None, meaning the time limit was exceeded
     if move is None:
         # Choose a random move from the available moves
@@ -208,6 +220,17 @@ def get_computer_move():
     # Return the move
     return move
 
+# Define a function to load the search statistics module shared by all three projects
+def load_search_stats():
+    # See the search_stats module docstring for why it is loaded by path
+    if "search_stats" not in sys.modules:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "search_stats.py")
+        spec = importlib.util.spec_from_file_location("search_stats", path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["search_stats"] = module
+        spec.loader.exec_module(module)
+    return sys.modules["search_stats"]
+
 # Define a function to get the human's move
 def get_human_move():
     # Loop until a valid move is entered
@@ -237,6 +260,10 @@ def play():
     # Print the initial board
     print_board()
 
+    # Set SEARCH_STATS=<file> to write one JSON record per computer move when the game ends
+    stats_path = os.environ.get("SEARCH_STATS")
+    records = [] if stats_path else None
+
     # Ask the user to choose who goes first
     turn = input("Do you want to go first? (Y/N) ")
     # Loop until the game is over
@@ -265,8 +292,14 @@ def play():
         else:
             # Print a message that the computer is thinking
             print("I am thinking...")
-            # Get the computer's move
-            move = get_computer_move()
+            # Get the computer's move, recording its search statistics if requested
+            if records is None:
+                move = get_computer_move()
+            else:
+                stats = load_search_stats().SearchStats("alpha_beta")
+                with stats.measure():
+                    move = get_computer_move(stats)
+                records.append(stats.to_dict())
             # Make the move on the board
             make_move(COMPUTER, move)
             # Print the updated board
@@ -278,6 +311,9 @@ def play():
                 break
             # Change the turn to the human
             turn = "Y"
+    if records is not None:
+        load_search_stats().write_records(records, stats_path)
+        print(f"Search stats written to {stats_path}")
     print("Thank you for playing the game. Have a nice day!")
 
 if __name__ == "__main__":
@@ -0,0 +1,146 @@
+""" Search instrumentation shared by the three projects.
+
+The project folders are run as plain scripts from their own directory, so the
+repository root is not on sys.path. Each script therefore loads this file by
+path the first time statistics are requested (see its load_search_stats()),
+which keeps importing the scripts free of sys.path changes and of any
+dependency on this file while statistics are off.
+"""
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class SearchStats:
+    """ Counters shared by the search algorithms of all three projects.
+
+    Every solver takes an optional ``stats`` argument. When it is None the
+    solver skips all bookkeeping, so uninstrumented runs behave exactly as before.
+    """
+
+    def __init__(self, name="", profile=False, trace_memory=False):
+        self.name = name
+        self.nodes_expanded = 0
+        self.nodes_generated = 0
+        self.peak_frontier = None  # None means the solver keeps no frontier/table
+        self.heuristic_evals = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cutoffs = 0
+        self.depths = {}  # depth -> number of nodes expanded at that depth
+        # A node is one state visited: a puzzle board, an N-Queen board whose
+        # heuristic was evaluated, or a game position, so nodes_per_second
+        # means the same thing for every solver
+        self.elapsed = 0.0
+        self.peak_memory = None
+        self.profile = cProfile.Profile() if profile else None
+        self.trace_memory = trace_memory
+
+    def expand(self, depth, count=1):
+        self.nodes_expanded += count
+        self.depths[depth] = self.depths.get(depth, 0) + count
+
+    def generate(self, count=1):
+        self.nodes_generated += count
+
+    def frontier(self, size):
+        if self.peak_frontier is None or size > self.peak_frontier:
+            self.peak_frontier = size
+
+    def cache(self, hit):
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+    def cutoff(self):
+        self.cutoffs += 1
+
+    def counted(self, func):
+        # Wrap a heuristic/evaluation function so every call is counted
+        def wrapper(*args, **kwargs):
+            self.heuristic_evals += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    @contextmanager
+    def measure(self):
+        """ Time the enclosed block, optionally under cProfile and tracemalloc.
+
+        Repeated blocks accumulate into the same record. Profiler and tracemalloc
+        overhead is included in ``elapsed``, so ``nodes_per_second`` is only
+        comparable between records taken with the same options. Only one
+        profiling SearchStats can be measuring at a time, since cProfile refuses
+        a second active profiler. If tracemalloc was already running, its peak is
+        left alone and ``peak_memory`` may include allocations made before the block.
+        """
+        started_tracing = False
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        if self.profile is not None:
+            self.profile.enable()
+        start_time = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.elapsed += time.perf_counter() - start_time
+            if self.profile is not None:
+                self.profile.disable()
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                self.peak_memory = max(self.peak_memory or 0, peak)
+                if started_tracing:
+                    tracemalloc.stop()
+
+    @property
+    def cache_hit_rate(self):
+        # None when the solver never looked anything up
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else None
+
+    @property
+    def nodes_per_second(self):
+        return self.nodes_expanded / self.elapsed if self.elapsed else None
+
+    def profile_summary(self, limit=15):
+        """ Return the top entries of the cProfile capture, sorted by cumulative time. """
+        if self.profile is None:
+            return None
+        out = io.StringIO()
+        pstats.Stats(self.profile, stream=out).sort_stats("cumulative").print_stats(limit)
+        return out.getvalue()
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'nodes_expanded': self.nodes_expanded,
+            'nodes_generated': self.nodes_generated,
+            'peak_frontier': self.peak_frontier,
+            'heuristic_evals': self.heuristic_evals,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'cache_hit_rate': self.cache_hit_rate,
+            'cutoffs': self.cutoffs,
+            'depths': {str(depth): count for depth, count in sorted(self.depths.items())},
+            'elapsed': self.elapsed,
+            'nodes_per_second': self.nodes_per_second,
+            'peak_memory': self.peak_memory,
+            'profile': self.profile_summary(),
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+def write_records(records, path):
+    """ Write SearchStats objects (or their dicts) as JSON lines for benchmark runners. """
+    with open(path, "w") as f:
+        for record in records:
+            if isinstance(record, SearchStats):
+                record = record.to_dict()
+            f.write(json.dumps(record) + "\n")
@@ -0,0 +1,151 @@
+import importlib.util
+import json
+import os
+import random
+import time
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+GOAL = (0, 1, 2, 3, 4, 5, 6, 7, 8)
+START = (1, 2, 5, 3, 4, 0, 6, 7, 8)
+
+
+def load_project(folder, filename, name):
+    # The projects are plain scripts (8_puzzle.py is not even a valid module name), so load them by path
+    path = os.path.join(ROOT, folder, filename)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+puzzle = load_project("HoangTuHuynh_4200p1", "8_puzzle.py", "eight_puzzle")
+game = load_project("HoangTuHuynh_4200p3", "game.py", "game")
+search_stats = puzzle.load_search_stats()
+
+
+@pytest.fixture
+def n_queen():
+    pytest.importorskip("numpy")
+    return load_project("HoangTuHuynh_4200p2", "n_queen.py", "n_queen")
+
+
+@pytest.fixture
+def game_board():
+    # alpha_beta works on the module-level board; start from a fixed position and clear it afterwards
+    game.make_move(game.COMPUTER, (3, 3))
+    game.make_move(game.HUMAN, (3, 4))
+    yield game.board
+    for row in game.board:
+        row[:] = [game.EMPTY] * game.BOARD_SIZE
+
+
+def solve(stats=None, heuristic_func=puzzle.h2):
+    start_state = puzzle.PuzzleState(START, GOAL, 0, heuristic_func)
+    return puzzle.astar_search(start_state, heuristic_func, 20, stats)
+
+
+def test_astar_counters():
+    calls = []
+
+    def h2(board, goal):
+        calls.append(board)
+        return puzzle.h2(board, goal)
+
+    stats = search_stats.SearchStats("astar")
+    with stats.measure():
+        solve(stats, h2)
+
+    assert stats.nodes_expanded == 4
+    assert stats.nodes_generated == 8
+    assert stats.heuristic_evals == len(calls) == 16  # 6 pushes plus heap tie-breaks
+    assert stats.peak_frontier == 4
+    assert (stats.cache_hits, stats.cache_misses) == (2, 6)
+    assert stats.cache_hit_rate == 0.25
+    assert stats.depths == {0: 1, 1: 1, 2: 1, 3: 1}
+    assert stats.elapsed > 0
+
+
+def test_stats_do_not_change_search():
+    plain_result, plain_cost = solve()
+    stats_result, stats_cost = solve(search_stats.SearchStats())
+
+    assert stats_cost == plain_cost == 4
+    assert stats_result.board == plain_result.board == GOAL
+    assert stats_result.moves == plain_result.moves == 3
+
+
+def test_hill_climbing_counters(n_queen):
+    board = [0, 1, 2, 3, 4, 5, 6, 7]
+    stats = search_stats.SearchStats("hill_climbing")
+
+    result, search_cost = n_queen.steepest_ascent_hill_climbing(list(board), stats)
+
+    assert (result, search_cost) == n_queen.steepest_ascent_hill_climbing(list(board))
+    assert stats.nodes_expanded == stats.nodes_generated == search_cost == 504
+    assert stats.depths == {step: 56 for step in range(9)}
+    assert stats.heuristic_evals == 9 * (1 + 56)  # Current board plus every neighbour, per step
+    assert stats.peak_frontier == 56
+    assert stats.cache_hit_rate is None
+
+
+def test_genetic_algorithm_counters(n_queen):
+    def run(stats=None):
+        random.seed(1)
+        n_queen.np.random.seed(1)
+        return n_queen.genetic_algorithm(20, 6, 5, stats)
+
+    stats = search_stats.SearchStats("genetic_algorithm")
+    result, search_cost = run(stats)
+
+    assert (result, search_cost) == run()
+    assert stats.nodes_expanded == stats.nodes_generated == search_cost == 100
+    assert stats.depths == {generation: 20 for generation in range(5)}
+    assert stats.peak_frontier == 20
+    # Per generation: selection fitnesses and the best-individual fitnesses (20 + 20) plus one
+    # heuristic check of the best; then the final max over the last population (20)
+    assert stats.heuristic_evals == 5 * (20 + 20 + 1) + 20
+
+
+def test_alpha_beta_counters(game_board):
+    def run(stats=None):
+        return game.alpha_beta(game.COMPUTER, -float("inf"), float("inf"), 2, time.time(), stats)
+
+    stats = search_stats.SearchStats("alpha_beta")
+    result = run(stats)
+
+    assert result == run()
+    assert stats.nodes_expanded == stats.nodes_generated + 1  # Every generated position is visited, plus the root
+    assert stats.depths[0] == 1
+    assert set(stats.depths) == {0, 1, 2}
+    assert stats.heuristic_evals == 2 * stats.depths[2]  # Two evaluate() calls per leaf
+    assert stats.cutoffs > 0
+    assert stats.peak_frontier is None
+
+
+def test_untracked_fields_are_none():
+    record = search_stats.SearchStats().to_dict()
+
+    assert record['peak_frontier'] is None
+    assert record['cache_hit_rate'] is None
+    assert record['nodes_per_second'] is None
+
+
+def test_write_records(tmp_path):
+    stats = search_stats.SearchStats("astar", profile=True, trace_memory=True)
+    with stats.measure():
+        solve(stats)
+    path = tmp_path / "stats.jsonl"
+
+    search_stats.write_records([stats, {'name': 'extra'}], str(path))
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    record = json.loads(lines[0])
+    assert record['name'] == 'astar'
+    assert record['nodes_expanded'] == 4
+    assert record['depths'] == {'0': 1, '1': 1, '2': 1, '3': 1}
+    assert record['peak_memory'] > 0
+    assert 'astar_search' in record['profile']
+    assert json.loads(lines[1]) == {'name': 'extra'}